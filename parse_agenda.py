@@ -9,26 +9,135 @@ Example:
 """
 
 import sys
+import os
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
 import fitz  # PyMuPDF
 
+try:
+    import orjson  # optional, faster JSON output
+except ImportError:
+    orjson = None
+
+
+# Plain-text extraction settings: the parser works line by line in content
+# stream order, so no reading-order sort and no dehyphenation (which would
+# join lines).
+_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_DEHYPHENATE
+
+# Pages past the first PARALLEL_MIN_PAGES are text-extracted in parallel
+# worker processes when there are at least this many of them; below it,
+# opening the PDF in each worker costs more than it saves.
+PARALLEL_MIN_PAGES = 16
+MAX_EXTRACT_WORKERS = 4
+
+# Meeting date, e.g. "Wednesday, February 11, 2026"
+# (groups: full date, month name, day, year)
+_DATE_RE = re.compile(
+    r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),\s+'
+    r'((January|February|March|April|May|June|July|August|September|'
+    r'October|November|December)\s+(\d{1,2}),\s+(\d{4}))'
+)
+_MONTHS = {
+    "January": 1, "February": 2, "March": 3, "April": 4,
+    "May": 5, "June": 6, "July": 7, "August": 8,
+    "September": 9, "October": 10, "November": 11, "December": 12,
+}
+
+# "Page X of Y" footers
+_PAGE_FOOTER_RE = re.compile(r'\s*Page\s+\d+\s+of\s+\d+\s*')
+
+# Cheap pre-check before looking for the ADJOURNMENT section header
+_ADJOURNMENT_RE = re.compile(r'adjournment', re.IGNORECASE)
+
+# Line patterns below are matched against left-stripped lines.  Page and
+# item numbers are matched as ASCII [0-9], which is cheaper than Unicode \d;
+# \s stays Unicode-aware since extracted text can contain non-breaking spaces.
+
+# Section header, e.g. "10. RESOLUTIONS"
+_SECTION_RE = re.compile(r'(\d{1,2})\.\s+([A-Z][A-Z\s\-\(\),&]+)')
+
+# Pattern A: page range + item number + title all on one line
+# e.g., "130 - 136 10.1 A Resolution authorizing..."
+_PATTERN_A = re.compile(
+    r'([0-9]{1,3})\s*-\s*([0-9]{1,3})\s+'
+    r'([0-9]{1,2}\.[0-9]{1,3})\s+'
+    r'(.+)'
+)
+
+# Pattern B: page range + item number on same line, title on next line(s)
+# e.g., "106 - 129 9.1 " then "Meeting Claims List"
+_PATTERN_B = re.compile(
+    r'([0-9]{1,3})\s*-\s*([0-9]{1,3})\s+'
+    r'([0-9]{1,2}\.[0-9]{1,3})\s*$'
+)
+
+# Pattern C: page range alone on one line, item number on next
+# e.g., "10 - 13" then "3.1" then "An Ordinance..."
+_PATTERN_C = re.compile(r'([0-9]{1,3})\s*-\s*([0-9]{1,3})\s*$')
+
+# Item number without a page range, alone on a line or followed by a title
+# e.g., "3.1 " or "5.1 " (title on next line: group 2 is None)
+# e.g., "5.10 Eve Taylor" or "8.13 Letter dated..." (title in group 2)
+_ITEM_RE = re.compile(r'([0-9]{1,2}\.[0-9]{1,3})(?:\s+(.*\S))?\s*$')
+
+# File number pattern; groups are reassembled as "Ord. 26-001" regardless of
+# the spacing after the dot (e.g. "Ord.26-001")
+_FILE_NUM_RE = re.compile(r'(Ord|Res)\.\s*([0-9]{2}-[0-9]{3})')
+
+# Title cleanup: trailing "Ord. 26-001 - Pdf" link text, runs of whitespace
+_TRAIL_PDF_RE = re.compile(r'\s*(?:Ord|Res)\.\s*\d{2}-\d{3}\s*-?\s*Pdf\s*$')
+_WS_RE = re.compile(r'\s+')
+
+# Line tags assigned by _tag_lines
+BLANK, PROSE, SECTION, PAT_A, PAT_B, PAT_C, ITEM_ALONE, ITEM_TITLE, FILE_NUM = range(9)
+
+# Tags that always end an item's title (item numbers end it only within
+# the current section)
+_BOUNDARY_TAGS = frozenset({SECTION, PAT_A, PAT_B, PAT_C, FILE_NUM})
+
+# Bound match methods tried by _tag_lines, in order, on lines starting with a
+# digit; a line gets the first tag that matches (ITEM_TITLE becomes
+# ITEM_ALONE when there is no title).
+_NUMBERED_LINE_MATCHERS = (
+    (SECTION, _SECTION_RE.match),
+    (PAT_A, _PATTERN_A.match),
+    (PAT_B, _PATTERN_B.match),
+    (PAT_C, _PATTERN_C.match),
+    (ITEM_TITLE, _ITEM_RE.match),
+)
+
+# Section title keywords -> section type, in priority order
+_SECTION_TYPES = (
+    (r'public request', "public_hearing"),
+    (r'first reading', "ordinance_first_reading"),
+    (r'second reading|hearing', "ordinance_second_reading"),
+    (r'claims', "claims"),
+    (r'resolution', "resolutions"),
+    (r'petition|communication', "petitions_communications"),
+    (r'officers', "officers_communications"),
+    (r'reports|directors', "reports_of_directors"),
+    (r'regular meeting', "regular_meeting"),
+    (r'reception', "reception_bid"),
+    (r'deferred|tabled', "deferred"),
+    (r'adjournment', "adjournment"),
+)
+_CLASSIFY_RE = re.compile(
+    "|".join(f"({pattern})" for pattern, _ in _SECTION_TYPES), re.IGNORECASE
+)
+
 
 def extract_meeting_info(text):
     """Extract meeting type and date from the first page text."""
     info = {"type": "regular", "date": None}
 
-    date_match = re.search(
-        r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),\s+'
-        r'((?:January|February|March|April|May|June|July|August|September|'
-        r'October|November|December)\s+\d{1,2},\s+\d{4})',
-        text
-    )
+    date_match = _DATE_RE.search(text)
     if date_match:
-        from datetime import datetime
+        _, month, day, year = date_match.groups()
         try:
-            dt = datetime.strptime(date_match.group(1), "%B %d, %Y")
-            info["date"] = dt.strftime("%Y-%m-%d")
+            info["date"] = date(int(year), _MONTHS[month], int(day)).isoformat()
         except ValueError:
             info["date"] = date_match.group(1)
 
@@ -42,32 +151,12 @@ def extract_meeting_info(text):
 
 def classify_section(number, title):
     """Classify a section by its number and title into a normalized type."""
-    title_lower = title.lower().strip()
-    if "public request" in title_lower:
-        return "public_hearing"
-    if "first reading" in title_lower:
-        return "ordinance_first_reading"
-    if "second reading" in title_lower or "hearing" in title_lower:
-        return "ordinance_second_reading"
-    if "claims" in title_lower:
-        return "claims"
-    if "resolution" in title_lower:
-        return "resolutions"
-    if "petition" in title_lower or "communication" in title_lower:
-        return "petitions_communications"
-    if "officers" in title_lower:
-        return "officers_communications"
-    if "reports" in title_lower or "directors" in title_lower:
-        return "reports_of_directors"
-    if "regular meeting" in title_lower:
-        return "regular_meeting"
-    if "reception" in title_lower:
-        return "reception_bid"
-    if "deferred" in title_lower or "tabled" in title_lower:
-        return "deferred"
-    if "adjournment" in title_lower:
-        return "adjournment"
-    return "other"
+    # Several keywords can appear in one title (e.g. "OFFICERS COMMUNICATIONS"),
+    # so the earliest entry in _SECTION_TYPES wins, not the leftmost match.
+    ranks = [m.lastindex for m in _CLASSIFY_RE.finditer(title)]
+    if not ranks:
+        return "other"
+    return _SECTION_TYPES[min(ranks) - 1][1]
 
 
 def item_type_from_section(section_type):
@@ -81,9 +170,11 @@ def item_type_from_section(section_type):
     return "other"
 
 
-def extract_links(doc):
+def extract_links(doc, max_pages=None):
     """Extract hyperlinks from the PDF and return lookup dicts.
 
+    Only the first max_pages pages are scanned (all pages when None).
+
     Returns:
         file_number_urls: dict mapping normalized file number (e.g. "Ord. 26-009")
                           to URL string
@@ -96,7 +187,9 @@ def extract_links(doc):
     file_num_in_link = re.compile(r'((?:Ord|Res)\.?\s*\d{2}-\d{3})')
     item_num_re = re.compile(r'(\d{1,2}\.\d{1,3})')
 
-    for page in doc:
+    pages_to_read = len(doc) if max_pages is None else min(len(doc), max_pages)
+    for page_num in range(pages_to_read):
+        page = doc[page_num]
         for link in page.get_links():
             uri = link.get("uri")
             if not uri:
@@ -128,59 +221,143 @@ def extract_links(doc):
     return file_number_urls, item_number_urls
 
 
-def parse_agenda(pdf_path):
-    """Parse agenda PDF and return structured data."""
-    doc = fitz.open(pdf_path)
+def _tag_lines(lines):
+    """Classify each left-stripped line by the first agenda pattern it matches.
 
-    # Extract hyperlinks before text parsing
-    file_number_urls, item_number_urls = extract_links(doc)
-
-    # Extract all text from all pages
-    full_text = ""
-    for page in doc:
-        full_text += page.get_text("text") + "\n"
+    Returns parallel lists (tags, groups): the tag constant for each line
+    and the captured groups of the matching pattern (None for BLANK/PROSE).
+    """
+    tags = [PROSE] * len(lines)
+    groups = [None] * len(lines)
+    file_num_match = _FILE_NUM_RE.match
+    for idx, line in enumerate(lines):
+        if not line:
+            tags[idx] = BLANK
+        elif line[0].isdecimal():
+            # Section headers, page ranges and item numbers all start with
+            # a digit; prose lines never reach the regexes.
+            for tag, match in _NUMBERED_LINE_MATCHERS:
+                m = match(line)
+                if m:
+                    if tag == ITEM_TITLE and m.group(2) is None:
+                        tag = ITEM_ALONE
+                    tags[idx] = tag
+                    groups[idx] = m.groups()
+                    break
+        elif line.startswith(("Ord.", "Res.")):
+            m = file_num_match(line)
+            if m:
+                tags[idx] = FILE_NUM
+                groups[idx] = m.groups()
+    return tags, groups
 
-    meeting_info = extract_meeting_info(full_text)
-    total_pages = len(doc)
 
-    lines = full_text.split("\n")
+def _extract_page_range(pdf_path, start, end):
+    """Extract plain text of pages start..end-1 (runs in a worker process)."""
+    with fitz.open(pdf_path) as doc:
+        return [doc[p].get_text("text", flags=_TEXT_FLAGS, sort=False)
+                for p in range(start, end)]
 
-    # Strip "Page X of Y" footers from lines
-    page_footer_re = re.compile(r'\s*Page\s+\d+\s+of\s+\d+\s*')
-    lines = [page_footer_re.sub('', l) for l in lines]
 
-    # Regex patterns
-    section_re = re.compile(r'^\s*(\d{1,2})\.\s+([A-Z][A-Z\s\-\(\),&]+)')
+def _clean_section_title(raw_title):
+    """Normalize a captured section title: collapse whitespace, trim ' -,'."""
+    return _WS_RE.sub(' ', raw_title.strip()).rstrip(' -,')
 
-    # Pattern A: page range + item number + title all on one line
-    # e.g., "130 - 136 10.1 A Resolution authorizing..."
-    pattern_a = re.compile(
-        r'^\s*(\d{1,3})\s*-\s*(\d{1,3})\s+'
-        r'(\d{1,2}\.\d{1,3})\s+'
-        r'(.+)'
-    )
 
-    # Pattern B: page range + item number on same line, title on next line(s)
-    # e.g., "106 - 129 9.1 " then "Meeting Claims List"
-    pattern_b_range_item = re.compile(
-        r'^\s*(\d{1,3})\s*-\s*(\d{1,3})\s+'
-        r'(\d{1,2}\.\d{1,3})\s*$'
-    )
+def _has_adjournment_header(page_text):
+    """Check whether a page contains the ADJOURNMENT section header."""
+    if not _ADJOURNMENT_RE.search(page_text):
+        return False
+    for line in page_text.split("\n"):
+        line = _PAGE_FOOTER_RE.sub('', line).lstrip()
+        if not line[:1].isdecimal():
+            continue
+        sm = _SECTION_RE.match(line)
+        if sm and classify_section(int(sm.group(1)),
+                                   _clean_section_title(sm.group(2))) == "adjournment":
+            return True
+    return False
+
+
+def extract_page_texts(doc, pdf_path):
+    """Return the plain text of the agenda pages of doc, in page order.
+
+    Pages are read one at a time and reading stops after the page with the
+    ADJOURNMENT section header, so documents attached after the agenda are
+    never parsed.  If a large document shows no adjournment within its
+    first PARALLEL_MIN_PAGES pages and at least PARALLEL_MIN_PAGES more
+    remain, those are split into contiguous ranges extracted by separate
+    processes, each with its own handle on pdf_path (PyMuPDF is not
+    thread-safe).  Shorter tails are read serially.  Worker results are cut
+    after the adjournment page too.
+    """
+    total_pages = len(doc)
+    workers = min(MAX_EXTRACT_WORKERS, os.cpu_count() or 1)
+    serial_pages = min(total_pages, PARALLEL_MIN_PAGES)
+    if workers < 2 or total_pages - serial_pages < PARALLEL_MIN_PAGES:
+        serial_pages = total_pages
+
+    page_texts = []
+    for pno in range(serial_pages):
+        text = doc[pno].get_text("text", flags=_TEXT_FLAGS, sort=False)
+        page_texts.append(text)
+        if _has_adjournment_header(text):
+            return page_texts
+
+    if serial_pages < total_pages:
+        step = -(-(total_pages - serial_pages) // workers)  # ceil division
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(_extract_page_range, pdf_path, start,
+                                 min(start + step, total_pages))
+                       for start in range(serial_pages, total_pages, step)]
+            page_texts.extend(text for fut in futures for text in fut.result())
+        # The workers read to the end of the document; drop everything
+        # after the adjournment page, as the serial loop would have.
+        for pno in range(serial_pages, len(page_texts)):
+            if _has_adjournment_header(page_texts[pno]):
+                del page_texts[pno + 1:]
+                break
+    return page_texts
+
+
+def _gather_title(stripped, tags, groups, i, sec_prefix):
+    """Collect title continuation lines starting at stripped[i].
+
+    Blank lines are skipped.  Stops at the next section header, page range,
+    file number, or item number starting with sec_prefix (e.g. "10.").
+
+    Returns (title_lines, index of the line that stopped the scan).
+    """
+    parts = []
+    while i < len(stripped):
+        tag = tags[i]
+        if tag == BLANK:
+            i += 1
+            continue
+        if tag in _BOUNDARY_TAGS:
+            break
+        if (tag == ITEM_ALONE or tag == ITEM_TITLE) and groups[i][0].startswith(sec_prefix):
+            break
+        parts.append(stripped[i])
+        i += 1
+    return parts, i
 
-    # Pattern C: page range alone on one line, item number on next
-    # e.g., "10 - 13" then "3.1" then "An Ordinance..."
-    pattern_c_range = re.compile(r'^\s*(\d{1,3})\s*-\s*(\d{1,3})\s*$')
 
-    # Item number alone on a line (may have title or not)
-    # e.g., "3.1 " or "5.1 " (title on next line)
-    item_number_alone = re.compile(r'^\s*(\d{1,2}\.\d{1,3})\s*$')
+def parse_sections(lines):
+    """Parse agenda text lines into a list of sections with their items.
 
-    # Item number with title on same line (no page range)
-    # e.g., "5.10 Eve Taylor" or "8.13 Letter dated..."
-    item_with_title = re.compile(r'^\s*(\d{1,2}\.\d{1,3})\s+(.+)')
+    Works purely on the extracted text lines (no PDF access), so the
+    parser can be run and profiled on its own.  Items have no "url" yet.
+    """
+    # Strip "Page X of Y" footers from lines.  Leading whitespace is dropped
+    # once here; trailing whitespace is kept for matching since it decides
+    # between some patterns (e.g. A vs. B), and stripped holds the fully
+    # stripped text used for titles.
+    lines = [_PAGE_FOOTER_RE.sub('', l).lstrip() for l in lines]
+    stripped = [l.rstrip() for l in lines]
 
-    # File number pattern
-    file_number_re = re.compile(r'((?:Ord|Res)\.\s*\d{2}-\d{3})')
+    tags, groups = _tag_lines(lines)
+    file_num_search = _FILE_NUM_RE.search
 
     sections = []
     current_section = None
@@ -188,15 +365,13 @@ def parse_agenda(pdf_path):
     # Parse into sections and items using a state machine
     i = 0
     while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
+        tag = tags[i]
+        g = groups[i]
 
         # Check for section header
-        sm = section_re.match(line)
-        if sm:
-            sec_num = int(sm.group(1))
-            sec_title = sm.group(2).strip()
-            sec_title = re.sub(r'\s+', ' ', sec_title).rstrip(' -,')
+        if tag == SECTION:
+            sec_num = int(g[0])
+            sec_title = _clean_section_title(g[1])
             sec_type = classify_section(sec_num, sec_title)
 
             if current_section:
@@ -208,6 +383,9 @@ def parse_agenda(pdf_path):
                 "type": sec_type,
                 "items": [],
             }
+            # Items in this section are numbered "<sec_num>.N"
+            sec_prefix = f"{sec_num}."
+            itype = item_type_from_section(sec_type)
             i += 1
             continue
 
@@ -215,51 +393,28 @@ def parse_agenda(pdf_path):
             i += 1
             continue
 
-        sec_num = current_section["number"]
-        sec_type = current_section["type"]
-        itype = item_type_from_section(sec_type)
-
         # Pattern A: "130 - 136 10.1 A Resolution authorizing..."
-        ma = pattern_a.match(line)
-        if ma:
-            candidate_item = ma.group(3)
-            if candidate_item.startswith(f"{sec_num}."):
-                page_start = int(ma.group(1))
-                page_end = int(ma.group(2))
+        if tag == PAT_A:
+            candidate_item = g[2]
+            if candidate_item.startswith(sec_prefix):
+                page_start = int(g[0])
+                page_end = int(g[1])
                 item_number = candidate_item
-                title_parts = [ma.group(4).strip()]
+                title_parts = [g[3].strip()]
                 i += 1
                 # Gather continuation lines
-                while i < len(lines):
-                    nline = lines[i].strip()
-                    if not nline:
-                        i += 1
-                        continue
-                    if section_re.match(lines[i]):
-                        break
-                    if pattern_a.match(lines[i]) or pattern_b_range_item.match(lines[i]) or pattern_c_range.match(lines[i]):
-                        break
-                    if file_number_re.match(nline):
-                        break
-                    # Check if it's a new item number
-                    if item_number_alone.match(lines[i]) or item_with_title.match(lines[i]):
-                        test_m = item_with_title.match(lines[i]) or item_number_alone.match(lines[i])
-                        if test_m and test_m.group(1).startswith(f"{sec_num}."):
-                            break
-                    title_parts.append(nline)
-                    i += 1
+                more_parts, i = _gather_title(stripped, tags, groups, i, sec_prefix)
+                title_parts.extend(more_parts)
 
                 title = " ".join(title_parts)
-                title = re.sub(r'\s*(?:Ord|Res)\.\s*\d{2}-\d{3}\s*-?\s*Pdf\s*$', '', title).strip()
-                title = re.sub(r'\s+', ' ', title)
+                title = _WS_RE.sub(' ', _TRAIL_PDF_RE.sub('', title)).strip()
 
                 # Look for file number in upcoming lines
                 file_number = None
                 for j in range(i, min(i + 3, len(lines))):
-                    fm = file_number_re.search(lines[j])
+                    fm = file_num_search(lines[j])
                     if fm:
-                        file_number = fm.group(1)
-                        file_number = re.sub(r'(Ord|Res)\.\s*', r'\1. ', file_number)
+                        file_number = f"{fm.group(1)}. {fm.group(2)}"
                         i = j + 1
                         break
 
@@ -274,44 +429,24 @@ def parse_agenda(pdf_path):
                 continue
 
         # Pattern B: "106 - 129 9.1" (item num on same line as range, no title)
-        mb = pattern_b_range_item.match(line)
-        if mb:
-            candidate_item = mb.group(3)
-            if candidate_item.startswith(f"{sec_num}."):
-                page_start = int(mb.group(1))
-                page_end = int(mb.group(2))
+        if tag == PAT_B:
+            candidate_item = g[2]
+            if candidate_item.startswith(sec_prefix):
+                page_start = int(g[0])
+                page_end = int(g[1])
                 item_number = candidate_item
-                title_parts = []
                 i += 1
                 # Gather title lines
-                while i < len(lines):
-                    nline = lines[i].strip()
-                    if not nline:
-                        i += 1
-                        continue
-                    if section_re.match(lines[i]):
-                        break
-                    if pattern_a.match(lines[i]) or pattern_b_range_item.match(lines[i]) or pattern_c_range.match(lines[i]):
-                        break
-                    if file_number_re.match(nline):
-                        break
-                    if item_number_alone.match(lines[i]) or item_with_title.match(lines[i]):
-                        test_m = item_with_title.match(lines[i]) or item_number_alone.match(lines[i])
-                        if test_m and test_m.group(1).startswith(f"{sec_num}."):
-                            break
-                    title_parts.append(nline)
-                    i += 1
+                title_parts, i = _gather_title(stripped, tags, groups, i, sec_prefix)
 
                 title = " ".join(title_parts)
-                title = re.sub(r'\s*(?:Ord|Res)\.\s*\d{2}-\d{3}\s*-?\s*Pdf\s*$', '', title).strip()
-                title = re.sub(r'\s+', ' ', title)
+                title = _WS_RE.sub(' ', _TRAIL_PDF_RE.sub('', title)).strip()
 
                 file_number = None
                 for j in range(i, min(i + 3, len(lines))):
-                    fm = file_number_re.search(lines[j])
+                    fm = file_num_search(lines[j])
                     if fm:
-                        file_number = fm.group(1)
-                        file_number = re.sub(r'(Ord|Res)\.\s*', r'\1. ', file_number)
+                        file_number = f"{fm.group(1)}. {fm.group(2)}"
                         i = j + 1
                         break
 
@@ -326,52 +461,31 @@ def parse_agenda(pdf_path):
                 continue
 
         # Pattern C: page range on its own, then item number on next line
-        mc = pattern_c_range.match(line)
-        if mc:
-            page_start = int(mc.group(1))
-            page_end = int(mc.group(2))
+        if tag == PAT_C:
+            page_start = int(g[0])
+            page_end = int(g[1])
             i += 1
             # Skip blank lines
-            while i < len(lines) and not lines[i].strip():
+            while i < len(lines) and tags[i] == BLANK:
                 i += 1
             if i >= len(lines):
                 continue
             # Next non-blank should be the item number
-            mi = item_number_alone.match(lines[i])
-            mi2 = item_with_title.match(lines[i])
-            if mi and mi.group(1).startswith(f"{sec_num}."):
-                item_number = mi.group(1)
+            ntag = tags[i]
+            if ntag == ITEM_ALONE and groups[i][0].startswith(sec_prefix):
+                item_number = groups[i][0]
                 i += 1
                 # Gather title lines
-                title_parts = []
-                while i < len(lines):
-                    nline = lines[i].strip()
-                    if not nline:
-                        i += 1
-                        continue
-                    if section_re.match(lines[i]):
-                        break
-                    if pattern_a.match(lines[i]) or pattern_b_range_item.match(lines[i]) or pattern_c_range.match(lines[i]):
-                        break
-                    if file_number_re.match(nline):
-                        break
-                    if item_number_alone.match(lines[i]) or item_with_title.match(lines[i]):
-                        test_m = item_with_title.match(lines[i]) or item_number_alone.match(lines[i])
-                        if test_m and test_m.group(1).startswith(f"{sec_num}."):
-                            break
-                    title_parts.append(nline)
-                    i += 1
+                title_parts, i = _gather_title(stripped, tags, groups, i, sec_prefix)
 
                 title = " ".join(title_parts)
-                title = re.sub(r'\s*(?:Ord|Res)\.\s*\d{2}-\d{3}\s*-?\s*Pdf\s*$', '', title).strip()
-                title = re.sub(r'\s+', ' ', title)
+                title = _WS_RE.sub(' ', _TRAIL_PDF_RE.sub('', title)).strip()
 
                 file_number = None
                 for j in range(i, min(i + 3, len(lines))):
-                    fm = file_number_re.search(lines[j])
+                    fm = file_num_search(lines[j])
                     if fm:
-                        file_number = fm.group(1)
-                        file_number = re.sub(r'(Ord|Res)\.\s*', r'\1. ', file_number)
+                        file_number = f"{fm.group(1)}. {fm.group(2)}"
                         i = j + 1
                         break
 
@@ -384,39 +498,22 @@ def parse_agenda(pdf_path):
                     "item_type": itype,
                 })
                 continue
-            elif mi2 and mi2.group(1).startswith(f"{sec_num}."):
+            elif ntag == ITEM_TITLE and groups[i][0].startswith(sec_prefix):
                 # Item number + title on same line after page range
-                item_number = mi2.group(1)
-                title_parts = [mi2.group(2).strip()]
+                item_number = groups[i][0]
+                title_parts = [groups[i][1]]
                 i += 1
-                while i < len(lines):
-                    nline = lines[i].strip()
-                    if not nline:
-                        i += 1
-                        continue
-                    if section_re.match(lines[i]):
-                        break
-                    if pattern_a.match(lines[i]) or pattern_b_range_item.match(lines[i]) or pattern_c_range.match(lines[i]):
-                        break
-                    if file_number_re.match(nline):
-                        break
-                    if item_number_alone.match(lines[i]) or item_with_title.match(lines[i]):
-                        test_m = item_with_title.match(lines[i]) or item_number_alone.match(lines[i])
-                        if test_m and test_m.group(1).startswith(f"{sec_num}."):
-                            break
-                    title_parts.append(nline)
-                    i += 1
+                more_parts, i = _gather_title(stripped, tags, groups, i, sec_prefix)
+                title_parts.extend(more_parts)
 
                 title = " ".join(title_parts)
-                title = re.sub(r'\s*(?:Ord|Res)\.\s*\d{2}-\d{3}\s*-?\s*Pdf\s*$', '', title).strip()
-                title = re.sub(r'\s+', ' ', title)
+                title = _WS_RE.sub(' ', _TRAIL_PDF_RE.sub('', title)).strip()
 
                 file_number = None
                 for j in range(i, min(i + 3, len(lines))):
-                    fm = file_number_re.search(lines[j])
+                    fm = file_num_search(lines[j])
                     if fm:
-                        file_number = fm.group(1)
-                        file_number = re.sub(r'(Ord|Res)\.\s*', r'\1. ', file_number)
+                        file_number = f"{fm.group(1)}. {fm.group(2)}"
                         i = j + 1
                         break
 
@@ -433,42 +530,19 @@ def parse_agenda(pdf_path):
         # Items without page ranges
 
         # Item number alone on a line, title on next line(s)
-        mi = item_number_alone.match(line)
-        if mi and mi.group(1).startswith(f"{sec_num}."):
-            item_number = mi.group(1)
+        if tag == ITEM_ALONE and g[0].startswith(sec_prefix):
+            item_number = g[0]
             i += 1
-            title_parts = []
-            while i < len(lines):
-                nline = lines[i].strip()
-                if not nline:
-                    i += 1
-                    continue
-                if section_re.match(lines[i]):
-                    break
-                if pattern_a.match(lines[i]) or pattern_b_range_item.match(lines[i]) or pattern_c_range.match(lines[i]):
-                    break
-                if file_number_re.match(nline):
-                    break
-                if item_number_alone.match(lines[i]):
-                    test_m = item_number_alone.match(lines[i])
-                    if test_m and test_m.group(1).startswith(f"{sec_num}."):
-                        break
-                if item_with_title.match(lines[i]):
-                    test_m = item_with_title.match(lines[i])
-                    if test_m and test_m.group(1).startswith(f"{sec_num}."):
-                        break
-                title_parts.append(nline)
-                i += 1
+            title_parts, i = _gather_title(stripped, tags, groups, i, sec_prefix)
 
             title = " ".join(title_parts)
-            title = re.sub(r'\s+', ' ', title).strip()
+            title = _WS_RE.sub(' ', title).strip()
 
             file_number = None
             for j in range(i, min(i + 3, len(lines))):
-                fm = file_number_re.search(lines[j])
+                fm = file_num_search(lines[j])
                 if fm:
-                    file_number = fm.group(1)
-                    file_number = re.sub(r'(Ord|Res)\.\s*', r'\1. ', file_number)
+                    file_number = f"{fm.group(1)}. {fm.group(2)}"
                     i = j + 1
                     break
 
@@ -483,42 +557,21 @@ def parse_agenda(pdf_path):
             continue
 
         # Item number with title on same line (no page range)
-        mi2 = item_with_title.match(line)
-        if mi2 and mi2.group(1).startswith(f"{sec_num}."):
-            item_number = mi2.group(1)
-            title_parts = [mi2.group(2).strip()]
+        if tag == ITEM_TITLE and g[0].startswith(sec_prefix):
+            item_number = g[0]
+            title_parts = [g[1]]
             i += 1
-            while i < len(lines):
-                nline = lines[i].strip()
-                if not nline:
-                    i += 1
-                    continue
-                if section_re.match(lines[i]):
-                    break
-                if pattern_a.match(lines[i]) or pattern_b_range_item.match(lines[i]) or pattern_c_range.match(lines[i]):
-                    break
-                if file_number_re.match(nline):
-                    break
-                if item_number_alone.match(lines[i]):
-                    test_m = item_number_alone.match(lines[i])
-                    if test_m and test_m.group(1).startswith(f"{sec_num}."):
-                        break
-                if item_with_title.match(lines[i]):
-                    test_m = item_with_title.match(lines[i])
-                    if test_m and test_m.group(1).startswith(f"{sec_num}."):
-                        break
-                title_parts.append(nline)
-                i += 1
+            more_parts, i = _gather_title(stripped, tags, groups, i, sec_prefix)
+            title_parts.extend(more_parts)
 
             title = " ".join(title_parts)
-            title = re.sub(r'\s+', ' ', title).strip()
+            title = _WS_RE.sub(' ', title).strip()
 
             file_number = None
             for j in range(i, min(i + 3, len(lines))):
-                fm = file_number_re.search(lines[j])
+                fm = file_num_search(lines[j])
                 if fm:
-                    file_number = fm.group(1)
-                    file_number = re.sub(r'(Ord|Res)\.\s*', r'\1. ', file_number)
+                    file_number = f"{fm.group(1)}. {fm.group(2)}"
                     i = j + 1
                     break
 
@@ -538,6 +591,28 @@ def parse_agenda(pdf_path):
     if current_section:
         sections.append(current_section)
 
+    return sections
+
+
+def parse_agenda(pdf_path):
+    """Parse agenda PDF and return structured data."""
+    doc = fitz.open(pdf_path)
+
+    # Extract text up to the adjournment page
+    page_texts = extract_page_texts(doc, pdf_path)
+
+    # Extract hyperlinks from the same agenda pages
+    file_number_urls, item_number_urls = extract_links(doc, len(page_texts))
+
+    full_text = "\n".join(page_texts) + "\n"
+
+    meeting_info = extract_meeting_info(full_text)
+    total_pages = len(doc)
+
+    lines = full_text.split("\n")
+
+    sections = parse_sections(lines)
+
     # Attach URLs to items
     for section in sections:
         for item in section["items"]:
@@ -557,6 +632,19 @@ def parse_agenda(pdf_path):
     }
 
 
+def _dump_json(result, path):
+    """Write result to path as JSON indented by 2 spaces.
+
+    Uses orjson when it is installed, otherwise the standard json module.
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
 def main():
     if len(sys.argv) < 3:
         print(f"Usage: {sys.argv[0]} <agenda.pdf> <output.json>")
@@ -567,30 +655,31 @@ def main():
 
     result = parse_agenda(pdf_path)
 
-    # Summary
-    total_items = sum(len(s["items"]) for s in result["sections"])
-    items_with_pages = sum(
-        1 for s in result["sections"]
-        for item in s["items"]
-        if item["page_start"] is not None
-    )
-    items_with_urls = sum(
-        1 for s in result["sections"]
-        for item in s["items"]
-        if item.get("url")
-    )
+    # Summary (counted in a single pass over all items)
+    total_items = 0
+    items_with_pages = 0
+    items_with_urls = 0
+    section_page_items = []
+    for s in result["sections"]:
+        page_items = 0
+        for item in s["items"]:
+            if item["page_start"] is not None:
+                page_items += 1
+            if item.get("url"):
+                items_with_urls += 1
+        total_items += len(s["items"])
+        items_with_pages += page_items
+        section_page_items.append(page_items)
     print(f"Parsed {total_items} items across {len(result['sections'])} sections")
     print(f"  {items_with_pages} items have page ranges")
     print(f"  {items_with_urls} items have URLs")
 
     # Detail per section
-    for s in result["sections"]:
+    for s, page_items in zip(result["sections"], section_page_items):
         if s["items"]:
-            page_items = sum(1 for it in s["items"] if it["page_start"] is not None)
             print(f"  Section {s['number']}: {s['title']} - {len(s['items'])} items ({page_items} with pages)")
 
-    with open(output_path, "w") as f:
-        json.dump(result, f, indent=2)
+    _dump_json(result, output_path)
 
     print(f"Output written to {output_path}")
 
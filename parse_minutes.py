@@ -15,8 +15,14 @@ Example:
 import sys
 import json
 import re
+from datetime import datetime
 import fitz  # PyMuPDF
 
+try:
+    import orjson  # optional, faster JSON output
+except ImportError:
+    orjson = None
+
 
 # Council members by last name (used to build the default full roster)
 # This is extracted from the header of the minutes document itself at runtime.
@@ -25,19 +31,126 @@ DEFAULT_MEMBERS = [
     "Brooks", "Zuppa", "Ephros", "Little", "Gilmore",
 ]
 
+# Plain-text extraction flags, the same ones get_text("text") uses
+_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT
+
+# Length of the document header (in characters) that holds the meeting
+# date/type and the roster of council members.
+HEADER_CHARS = 3000
+
+# Meeting date, e.g. "Wednesday, January 28, 2026"
+_DATE_RE = re.compile(
+    r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),\s+'
+    r'((?:January|February|March|April|May|June|July|August|September|'
+    r'October|November|December)\s+\d{1,2},\s+\d{4})'
+)
+
+# Roster line: "FirstName [MI.] LastName[, Jr.], Councilperson"
+_COUNCILPERSON_RE = re.compile(r'^(.+?),?\s+Councilperson', re.MULTILINE)
+_SUFFIX_JR_RE = re.compile(r',\s*Jr\.?\s*$')
+
+# Words that end a "... Councilperson" line but aren't names
+_ROSTER_STOPWORDS = frozenset((
+    'of', 'the', 'a', 'and', 'acting', 'jr',
+    'large', 'ward', 'council', 'pro', 'tempore',
+    'present', 'absent', 'members', 'nine', 'eight',
+))
+
+# End of the minutes proper
+_ADJOURNMENT_RE = re.compile(r'^\s*12\.\s+ADJOURNMENT')
+_ADJOURNMENT_LINE_RE = re.compile(r'^[^\S\n]*12\.[^\S\n]+ADJOURNMENT', re.MULTILINE)
+
+# "Councilperson <Name>", "Council president pro temp <Name>",
+# "Council person at large <Name>"
+_NAMED_MEMBER_RE = re.compile(
+    r'(?:Council\s*person(?:\s+at\s+large)?|Council\s+president\s+pro\s+temp)\s+([A-Z][a-z]+)',
+    re.IGNORECASE
+)
+
+# Vote detail split into segments by keyword: "...: nay ...: Abstain"
+_VOTE_KEYWORD_SPLIT_RE = re.compile(r':\s*(nay|abstain)', re.IGNORECASE)
+
+# Item number in link context text, e.g. "10.15"
+_URL_ITEM_RE = re.compile(r'(\d{1,2}\.\d{1,2})')
+
+# "Councilperson Gilmore was absent." -- the first such phrase on each line,
+# matched over many lines joined with newlines
+_ABSENT_RE = re.compile(
+    r'^.*?Councilperson[^\S\n]+(\w+)[^\S\n]+was[^\S\n]+absent',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Section title on the line after a section number that stands alone
+_SECTION_TITLE_RE = re.compile(r'^[A-Z][A-Z\s\-\(\),&]+')
+
+# Per-line dispatch: an item number ("10.15 ..."), a full section header, or
+# a section number alone. The three forms are mutually exclusive, so one
+# anchored match tells the main loop which kind of line it is looking at.
+# Items are by far the most common, so they are tried first.
+_LINE_RE = re.compile(
+    r'^\s*(?:(?P<item>\d{1,2}\.\d{1,2})\s'
+    r'|(?P<sec_full>\d{1,2})\.\s+(?P<title>[A-Z][A-Z\s\-\(\),&]+)'
+    r'|(?P<sec_only>\d{1,2})\.\s*$)'
+)
+
+# Sections whose items carry votes: ordinances (3, 4), claims (9) and
+# resolutions (10)
+_VOTE_SECS = frozenset(('3', '4', '9', '10'))
+
+# Sections whose item numbers end the item being gathered
+_ITEM_SECS = frozenset(('3', '4', '5', '6', '7', '8', '9', '10', '11', '12'))
+
+_ITEM_NUM_PREFIX_RE = re.compile(r'^\s*\d{1,2}\.\d{1,2}\s+')
+_FILE_NUM_RE = re.compile(r'((?:Ord|Res)\.\s*\d{2}-\d{3})')
+_ORDRES_FIX_RE = re.compile(r'(Ord|Res)\.\s*')
+
+# Vote result patterns
+# "Introduced 9-0", "Adopted 9-0", "Approved 9-0", "Withdrawn 9-0", "Withdrawn", "Approved 8-1  detail"
+_VOTE_RE = re.compile(
+    r'^\s*(Introduced|Adopted|Approved|Withdrawn|Defeated|Tabled|Postponed|Passed|Carried)'
+    r'(?:\s*[-–]?\s*(\d+-\d+(?:-\d+)?))?'
+    r'(?:\s{2,}(.+))?',
+    re.IGNORECASE
+)
+
+# Continuation of vote detail (e.g., "Councilperson Lavarro, and..."
+# or "Gilmore, Council person at large Brooks..."
+# or "Abstain" / "nay" on its own line)
+_CONT_RE = re.compile(
+    r'^(?:Council\s*person|Council\s+president|and\s+Council|[A-Z][a-z]+,\s|(?:nay|abstain)\s*$)',
+    re.IGNORECASE
+)
+
+# Non-title lines inside an item: "Withdrawn - Pdf", "Res. - Pdf"
+_WITHDRAWN_PDF_RE = re.compile(r'^Withdrawn\s*-?\s*Pdf\s*$')
+_BARE_PDF_RE = re.compile(r'^(?:Ord|Res)\.\s*-?\s*Pdf\s*$')
+
+# Inline votes: "Meeting Claims List: Approved-9-0", or claims ": -9-0"
+_INLINE_VOTE_RE = re.compile(
+    r'(Adopted|Approved|Withdrawn|Defeated|Passed|Carried)\s*[-–]?\s*(\d+-\d+(?:-\d+)?)',
+    re.IGNORECASE
+)
+_CLAIMS_VOTE_RE = re.compile(r':\s*-?\s*(\d+-\d+(?:-\d+)?)')
+
+# Title cleanup
+_WS_RE = re.compile(r'\s+')
+_TRAIL_FILE_RE = re.compile(
+    r'\s*(?:Ord|Res)\.\s*(?:\d{2}-\d{3})?\s*-?\s*(?:Pdf|Withdrawn\s*-?\s*Pdf)?\s*$'
+)
+_TRAIL_WITHDRAWN_RE = re.compile(r'\s*Withdrawn\s*-?\s*Pdf\s*$')
+_INLINE_FILE_RE = re.compile(r'\s*(?:Ord|Res)\.\s*\d{2}-\d{3}\s*-?\s*')
+_INLINE_TALLY_RE = re.compile(
+    r':\s*(?:Approved|Withdrawn|Defeated)\s*-?\s*\d+-\d+(?:-\d+)?',
+    re.IGNORECASE
+)
+
 
 def extract_meeting_info(text):
     """Extract meeting type, date, and council member roster."""
     info = {"type": "regular", "date": None}
 
-    date_match = re.search(
-        r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),\s+'
-        r'((?:January|February|March|April|May|June|July|August|September|'
-        r'October|November|December)\s+\d{1,2},\s+\d{4})',
-        text
-    )
+    date_match = _DATE_RE.search(text)
     if date_match:
-        from datetime import datetime
         try:
             dt = datetime.strptime(date_match.group(1), "%B %d, %Y")
             info["date"] = dt.strftime("%Y-%m-%d")
@@ -59,26 +172,23 @@ def extract_roster(text):
     (e.g., 'Lavarro' not 'Lavarro, Jr.').
     """
     members = []
+    seen = set()
     # Pattern: "FirstName [MI.] LastName[, Jr.], Councilperson"
     # We need to extract the last name before any ", Jr." or ", Councilperson"
-    for m in re.finditer(
-        r'^(.+?),?\s+Councilperson',
-        text[:3000], re.MULTILINE
-    ):
-        full = m.group(1).strip()
+    for full in _COUNCILPERSON_RE.findall(text[:HEADER_CHARS]):
+        full = full.strip()
         # Remove trailing ", Jr." or similar suffixes
-        full_clean = re.sub(r',\s*Jr\.?\s*$', '', full).strip()
+        if 'Jr' in full:
+            full = _SUFFIX_JR_RE.sub('', full).strip()
         # Last name is the last word
-        parts = full_clean.split()
+        parts = full.split()
         if parts:
             last = parts[-1].rstrip(',.')
             # Skip false positives (common words that aren't names)
-            if last.lower() in ('of', 'the', 'a', 'and', 'acting', 'jr',
-                                'large', 'ward', 'council', 'pro', 'tempore',
-                                'present', 'absent', 'members', 'nine', 'eight'):
+            if last.lower() in _ROSTER_STOPWORDS or last in seen:
                 continue
-            if last not in members:
-                members.append(last)
+            seen.add(last)
+            members.append(last)
     return members if members else DEFAULT_MEMBERS
 
 
@@ -92,11 +202,18 @@ def find_minutes_end(lines):
         stripped = line.strip()
         if "Reviewed and found to be correct" in stripped:
             return i
-        if re.match(r'^\s*12\.\s+ADJOURNMENT', stripped):
+        if _ADJOURNMENT_RE.match(stripped):
             return i + 10  # include a few lines after
     return len(lines)
 
 
+def _page_ends_minutes(text):
+    """Return True if a page contains one of the end markers that
+    find_minutes_end() looks for."""
+    return ("Reviewed and found to be correct" in text
+            or _ADJOURNMENT_LINE_RE.search(text) is not None)
+
+
 def parse_vote_tally(tally_str):
     """Parse a vote tally string like '9-0', '8-1', '7-0-2', '6-3'.
 
@@ -109,34 +226,41 @@ def parse_vote_tally(tally_str):
     return ayes, nays, abstentions
 
 
-def extract_named_members(text, roster):
+def roster_lookup(roster):
+    """Map lowercased last names to their roster spelling.
+
+    The first roster entry wins if two differ only in case.
+    """
+    lookup = {}
+    for member in roster:
+        lookup.setdefault(member.lower(), member)
+    return lookup
+
+
+def extract_named_members(text, roster_lower):
     """Extract council member last names mentioned in a vote detail line.
 
+    roster_lower is the mapping built by roster_lookup(); names not on the
+    roster are returned as written.
+
     Handles patterns like:
     - 'Councilperson Lavarro: nay'
     - 'Councilperson Singh and Councilperson Little: Abstain'
     - 'Council president pro temp Gilmore, Councilperson Lavarro, and Councilperson Griffin: nay'
     """
     found = []
-    # Match "Councilperson <Name>", "Council president pro temp <Name>",
-    # "Council person at large <Name>"
-    for m in re.finditer(
-        r'(?:Council\s*person(?:\s+at\s+large)?|Council\s+president\s+pro\s+temp)\s+([A-Z][a-z]+)',
-        text, re.IGNORECASE
-    ):
+    for m in _NAMED_MEMBER_RE.finditer(text):
         name = m.group(1)
-        # Match against roster
-        for member in roster:
-            if member.lower() == name.lower():
-                found.append(member)
-                break
-        else:
-            found.append(name)
+        found.append(roster_lower.get(name.lower(), name))
     return found
 
 
-def build_vote_breakdown(result, tally_str, detail_text, roster):
-    """Build the full vote breakdown dict from parsed components."""
+def build_vote_breakdown(result, tally_str, detail_text, roster, roster_lower=None):
+    """Build the full vote breakdown dict from parsed components.
+
+    roster_lower may be passed in to avoid rebuilding roster_lookup(roster)
+    for every item.
+    """
     ayes_count, nays_count, abstain_count = parse_vote_tally(tally_str)
 
     votes = {
@@ -152,15 +276,18 @@ def build_vote_breakdown(result, tally_str, detail_text, roster):
     named_nay = []
     named_abstain = []
 
-    if detail_text:
+    # Every keyword follows a colon, so details without one name nobody.
+    if detail_text and ':' in detail_text:
         # Split detail into segments by vote keywords (nay/abstain)
         # and assign names in each segment to the appropriate list.
-        segments = re.split(r':\s*(nay|abstain)', detail_text, flags=re.IGNORECASE)
+        if roster_lower is None:
+            roster_lower = roster_lookup(roster)
+        segments = _VOTE_KEYWORD_SPLIT_RE.split(detail_text)
         # segments alternates: [text_before_keyword, keyword, text_before_next, keyword, ...]
         for idx in range(0, len(segments) - 1, 2):
             segment_text = segments[idx]
             keyword = segments[idx + 1].lower()
-            names = extract_named_members(segment_text, roster)
+            names = extract_named_members(segment_text, roster_lower)
             if keyword == 'nay':
                 named_nay.extend(names)
             elif keyword == 'abstain':
@@ -168,13 +295,10 @@ def build_vote_breakdown(result, tally_str, detail_text, roster):
 
     # Build lists
     # Start by assuming everyone voted aye, then adjust
-    accounted = set()
-    for name in named_nay:
-        votes["nay"].append(name)
-        accounted.add(name)
-    for name in named_abstain:
-        votes["abstain"].append(name)
-        accounted.add(name)
+    votes["nay"] = named_nay
+    votes["abstain"] = named_abstain
+    accounted = set(named_nay)
+    accounted.update(named_abstain)
 
     # Total members present = ayes + nays + abstentions
     total_present = ayes_count + nays_count + abstain_count
@@ -212,7 +336,6 @@ def extract_urls(doc, max_pages=20):
     agenda item number (e.g., '10.15').  Duplicate URLs for the same item
     are collapsed.
     """
-    item_re = re.compile(r'(\d{1,2}\.\d{1,2})')
     urls = {}
     pages_to_read = min(len(doc), max_pages)
     for page_num in range(pages_to_read):
@@ -225,7 +348,7 @@ def extract_urls(doc, max_pages=20):
             # Look at text to the left of the link on the same line
             search_rect = fitz.Rect(0, rect.y0 - 5, rect.x0, rect.y1 + 5)
             nearby = page.get_text('text', clip=search_rect).strip()
-            m = item_re.search(nearby)
+            m = _URL_ITEM_RE.search(nearby)
             if m:
                 item_num = m.group(1)
                 if item_num not in urls:
@@ -237,41 +360,43 @@ def parse_minutes(pdf_path, max_pages=20):
     """Parse minutes PDF and extract voting breakdowns."""
     doc = fitz.open(pdf_path)
 
-    # Only read the first max_pages pages (minutes text is typically < 15 pages)
+    # Only read the first max_pages pages (minutes text is typically < 15 pages),
+    # and stop once every line up to the end of the minutes has been read;
+    # anything later is the rest of a minutes packet.
+    # Page text goes straight into lines; only the header pages are also
+    # kept as text for the meeting info and roster.
     pages_to_read = min(len(doc), max_pages)
-    full_text = ""
+    lines = []
+    header_chunks = []
+    header_len = 0
+    end_idx = None
+    pages_read = 0
     for i in range(pages_to_read):
-        full_text += doc[i].get_text("text") + "\n"
-
-    meeting_info = extract_meeting_info(full_text)
-    roster = extract_roster(full_text)
-    item_urls = extract_urls(doc, max_pages)
+        # Going straight to the TextPage skips get_text()'s option handling
+        text = doc[i].get_textpage(flags=_TEXT_FLAGS).extractText()
+        pages_read = i + 1
+        if header_len < HEADER_CHARS:
+            header_chunks.append(text + "\n")
+            header_len += len(text) + 1
+        lines.extend(text.split("\n"))
+        if end_idx is None and _page_ends_minutes(text):
+            end_idx = find_minutes_end(lines)
+        if end_idx is not None and len(lines) >= end_idx:
+            break
+    # Each page was followed by a newline, which leaves a trailing empty line
+    lines.append("")
+    header_text = "".join(header_chunks)
+
+    meeting_info = extract_meeting_info(header_text)
+    roster = extract_roster(header_text)
+    roster_lower = roster_lookup(roster)
+    item_urls = extract_urls(doc, pages_read)
 
-    lines = full_text.split("\n")
     end_idx = find_minutes_end(lines)
     lines = lines[:end_idx]
 
     # Parse roll call for absences
-    roll_call_absent = []
-    for line in lines[:100]:
-        # "Councilperson Gilmore was absent."
-        m = re.search(r'Councilperson\s+(\w+)\s+was\s+absent', line, re.IGNORECASE)
-        if m:
-            roll_call_absent.append(m.group(1))
-
-    # Regex patterns
-    section_re = re.compile(r'^\s*(\d{1,2})\.\s*$|^\s*(\d{1,2})\.\s+([A-Z])')
-    item_re = re.compile(r'^\s*(\d{1,2}\.\d{1,2})\s')
-    file_number_re = re.compile(r'((?:Ord|Res)\.\s*\d{2}-\d{3})')
-
-    # Vote result patterns
-    # "Introduced 9-0", "Adopted 9-0", "Approved 9-0", "Withdrawn 9-0", "Withdrawn", "Approved 8-1  detail"
-    vote_re = re.compile(
-        r'^\s*(Introduced|Adopted|Approved|Withdrawn|Defeated|Tabled|Postponed|Passed|Carried)'
-        r'(?:\s*[-–]?\s*(\d+-\d+(?:-\d+)?))?'
-        r'(?:\s{2,}(.+))?',
-        re.IGNORECASE
-    )
+    roll_call_absent = _ABSENT_RE.findall("\n".join(lines[:100]))
 
     items = []
     current_section = None
@@ -279,35 +404,35 @@ def parse_minutes(pdf_path, max_pages=20):
 
     while i < len(lines):
         line = lines[i]
-        stripped = line.strip()
+
+        lm = _LINE_RE.match(line)
+        if lm is None:
+            i += 1
+            continue
 
         # Track current section (handles both "10. RESOLUTIONS" on one line
         # and "10.\n RESOLUTIONS" split across lines)
-        sm = re.match(r'^\s*(\d{1,2})\.\s+([A-Z][A-Z\s\-\(\),&]+)', line)
-        if not sm:
-            # Check for section number alone on a line: "10. " or "10."
-            sm2 = re.match(r'^\s*(\d{1,2})\.\s*$', line)
-            if sm2:
-                # Peek at next non-blank line for section title
-                peek = i + 1
-                while peek < len(lines) and not lines[peek].strip():
-                    peek += 1
-                if peek < len(lines) and re.match(r'^[A-Z][A-Z\s\-\(\),&]+', lines[peek].strip()):
-                    sm = sm2
-        if sm:
-            sec_num = int(sm.group(1))
-            current_section = sec_num
+        sec_num = lm.group('sec_full')
+        if sec_num is None and lm.group('sec_only') is not None:
+            # Section number alone on a line: "10. " or "10."
+            # Peek at next non-blank line for section title
+            peek = i + 1
+            while peek < len(lines) and (not lines[peek] or lines[peek].isspace()):
+                peek += 1
+            if peek < len(lines) and _SECTION_TITLE_RE.match(lines[peek].strip()):
+                sec_num = lm.group('sec_only')
+        if sec_num is not None:
+            current_section = int(sec_num)
             i += 1
             continue
 
         # Look for item numbers
-        im = item_re.match(line)
-        if im:
-            item_number = im.group(1)
+        item_number = lm.group('item')
+        if item_number:
             sec_prefix = item_number.split('.')[0]
 
             # Only process ordinances (3, 4) and resolutions (10), claims (9)
-            if sec_prefix not in ('3', '4', '9', '10'):
+            if sec_prefix not in _VOTE_SECS:
                 i += 1
                 continue
 
@@ -316,24 +441,20 @@ def parse_minutes(pdf_path, max_pages=20):
             i += 1
             while i < len(lines):
                 nline = lines[i]
-                nstripped = nline.strip()
 
-                # Stop if we hit a new item in the same or different section
-                if item_re.match(nline):
-                    nm = item_re.match(nline)
+                nm = _LINE_RE.match(nline)
+                if nm:
+                    candidate = nm.group('item')
+                    if candidate is None:
+                        # Stop if we hit a new section header, including a
+                        # standalone section number: "10. " or "9. "
+                        break
+                    # Stop if we hit a new item in the same or different section.
                     # Make sure it's actually a new item, not a "Block 4801, Lot 1" etc.
-                    candidate = nm.group(1)
                     candidate_sec = candidate.split('.')[0]
-                    if candidate_sec in ('3', '4', '5', '6', '7', '8', '9', '10', '11', '12'):
+                    if candidate_sec in _ITEM_SECS:
                         break
 
-                # Stop if we hit a new section header
-                if re.match(r'^\s*(\d{1,2})\.\s+([A-Z][A-Z\s\-\(\),&]+)', nline):
-                    break
-                # Also stop at standalone section number: "10. " or "9. "
-                if re.match(r'^\s*(\d{1,2})\.\s*$', nline):
-                    break
-
                 item_lines.append(nline)
                 i += 1
 
@@ -341,40 +462,41 @@ def parse_minutes(pdf_path, max_pages=20):
             title_parts = []
             vote_result = None
             vote_tally = None
-            vote_detail_parts = []
+            # Detail parts of each vote line: its own trailing detail, then
+            # the continuation lines that follow it
+            vote_details = []
+            open_details = []
             file_number = None
             found_vote = False
 
             for j, iline in enumerate(item_lines):
                 istripped = iline.strip()
 
+                # Continuation of vote detail (blank lines don't end it)
+                if open_details and istripped:
+                    if _CONT_RE.match(istripped):
+                        for parts in open_details:
+                            parts.append(istripped)
+                    else:
+                        open_details = []
+
                 # Check for file number
-                fm = file_number_re.search(istripped)
+                fm = _FILE_NUM_RE.search(istripped)
                 if fm:
                     file_number = fm.group(1)
-                    file_number = re.sub(r'(Ord|Res)\.\s*', r'\1. ', file_number)
+                    file_number = _ORDRES_FIX_RE.sub(r'\1. ', file_number)
 
                 # Check for vote line
-                vm = vote_re.match(istripped)
+                vm = _VOTE_RE.match(istripped)
                 if vm:
                     vote_result = vm.group(1).capitalize()
                     if vm.group(2):
                         vote_tally = vm.group(2)
-                    if vm.group(3):
-                        vote_detail_parts.append(vm.group(3).strip())
+                    parts = [vm.group(3).strip()] if vm.group(3) else []
+                    vote_details.append(parts)
+                    # Detail may continue on the next line(s)
+                    open_details.append(parts)
                     found_vote = True
-                    # Check if detail continues on next line(s)
-                    for k in range(j + 1, len(item_lines)):
-                        kstripped = item_lines[k].strip()
-                        if not kstripped:
-                            continue
-                        # Continuation of vote detail (e.g., "Councilperson Lavarro, and..."
-                        # or "Gilmore, Council person at large Brooks..."
-                        # or "Abstain" / "nay" on its own line)
-                        if re.match(r'^(?:Council\s*person|Council\s+president|and\s+Council|[A-Z][a-z]+,\s|(?:nay|abstain)\s*$)', kstripped, re.IGNORECASE):
-                            vote_detail_parts.append(kstripped)
-                        else:
-                            break
                     continue
 
                 # If we haven't found the vote yet, this is title text
@@ -382,17 +504,17 @@ def parse_minutes(pdf_path, max_pages=20):
                     # Skip the item number from first line
                     if j == 0:
                         # Remove the item number prefix
-                        title_text = re.sub(r'^\s*\d{1,2}\.\d{1,2}\s+', '', iline).strip()
+                        title_text = _ITEM_NUM_PREFIX_RE.sub('', iline).strip()
                         if title_text:
                             title_parts.append(title_text)
                     else:
                         # Skip pure file number lines and "Withdrawn - Pdf" lines
-                        if file_number_re.match(istripped):
+                        if _FILE_NUM_RE.match(istripped):
                             continue
-                        if re.match(r'^Withdrawn\s*-?\s*Pdf\s*$', istripped):
+                        if _WITHDRAWN_PDF_RE.match(istripped):
                             continue
                         # Skip lines that are just "Res. - Pdf" (no number)
-                        if re.match(r'^(?:Ord|Res)\.\s*-?\s*Pdf\s*$', istripped):
+                        if _BARE_PDF_RE.match(istripped):
                             continue
                         title_parts.append(istripped)
 
@@ -400,29 +522,35 @@ def parse_minutes(pdf_path, max_pages=20):
             # Also handles ": -9-0" (missing result keyword, treat as approved)
             if not found_vote:
                 combined = " ".join(il.strip() for il in item_lines)
-                cm = re.search(r'(Adopted|Approved|Withdrawn|Defeated|Passed|Carried)\s*[-–]?\s*(\d+-\d+(?:-\d+)?)', combined, re.IGNORECASE)
+                cm = _INLINE_VOTE_RE.search(combined)
                 if cm:
                     vote_result = cm.group(1).capitalize()
                     vote_tally = cm.group(2)
                 elif sec_prefix == '9':
                     # Claims sometimes have just ": -9-0" with no keyword
-                    cm2 = re.search(r':\s*-?\s*(\d+-\d+(?:-\d+)?)', combined)
+                    cm2 = _CLAIMS_VOTE_RE.search(combined)
                     if cm2:
                         vote_result = "Approved"
                         vote_tally = cm2.group(1)
 
             title = " ".join(title_parts)
-            title = re.sub(r'\s+', ' ', title).strip()
+            title = _WS_RE.sub(' ', title).strip()
+            # The cleanups below only apply when their literal text is
+            # present, so most titles skip the regexes entirely.
             # Clean trailing file number references from title
-            title = re.sub(r'\s*(?:Ord|Res)\.\s*(?:\d{2}-\d{3})?\s*-?\s*(?:Pdf|Withdrawn\s*-?\s*Pdf)?\s*$', '', title).strip()
-            title = re.sub(r'\s*Withdrawn\s*-?\s*Pdf\s*$', '', title).strip()
+            if 'Ord.' in title or 'Res.' in title:
+                title = _TRAIL_FILE_RE.sub('', title).strip()
+            if 'Withdrawn' in title:
+                title = _TRAIL_WITHDRAWN_RE.sub('', title).strip()
             # Remove inline file numbers that leaked into title text
-            title = re.sub(r'\s*(?:Ord|Res)\.\s*\d{2}-\d{3}\s*-?\s*', ' ', title).strip()
-            title = re.sub(r'\s+', ' ', title)
+            if 'Ord.' in title or 'Res.' in title:
+                title = _INLINE_FILE_RE.sub(' ', title).strip()
+                title = _WS_RE.sub(' ', title)
             # Remove inline vote tallies from claims titles
-            title = re.sub(r':\s*(?:Approved|Withdrawn|Defeated)\s*-?\s*\d+-\d+(?:-\d+)?', '', title, flags=re.IGNORECASE).strip()
+            if ':' in title:
+                title = _INLINE_TALLY_RE.sub('', title).strip()
 
-            vote_detail = " ".join(vote_detail_parts)
+            vote_detail = " ".join(p for parts in vote_details for p in parts)
 
             # Build vote breakdown
             if vote_result:
@@ -436,7 +564,7 @@ def parse_minutes(pdf_path, max_pages=20):
                     }
                 elif vote_tally:
                     votes = build_vote_breakdown(
-                        vote_result, vote_tally, vote_detail, roster
+                        vote_result, vote_tally, vote_detail, roster, roster_lower
                     )
                 else:
                     votes = None
@@ -472,6 +600,19 @@ def parse_minutes(pdf_path, max_pages=20):
     }
 
 
+def _dump_json(result, path):
+    """Write result to path as JSON indented by 2 spaces.
+
+    Uses orjson when it is installed, otherwise the standard json module.
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
 def main():
     if len(sys.argv) < 3:
         print(f"Usage: {sys.argv[0]} <minutes.pdf> <output.json>")
@@ -495,8 +636,7 @@ def main():
     for r, count in sorted(results.items()):
         print(f"    {r}: {count}")
 
-    with open(output_path, "w") as f:
-        json.dump(result, f, indent=2)
+    _dump_json(result, output_path)
 
     print(f"Output written to {output_path}")
 
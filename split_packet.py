@@ -12,8 +12,15 @@ import sys
 import os
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import fitz  # PyMuPDF
 
+try:
+    import orjson  # optional, faster JSON output
+except ImportError:
+    orjson = None
+
 
 # Map section types to output subdirectory names
 SECTION_DIR_MAP = {
@@ -23,15 +30,32 @@ SECTION_DIR_MAP = {
     "claims": "claims",
 }
 
+# Plain-text extraction flags, the same ones get_text("text") uses
+_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT
+
+# Packets with at least this many items are split by parallel worker
+# processes; below it, opening the packet in each worker costs more than
+# it saves.
+PARALLEL_MIN_ITEMS = 16
+MAX_SPLIT_WORKERS = 4
+
+# Filename cleanup: dots and whitespace become dashes, anything else that
+# isn't a word character or dash is dropped; then dash runs are collapsed.
+_FILENAME_CHAR_RE = re.compile(r'([.\s])|[^\w\-]')
+_DASHES_RE = re.compile(r'-+')
+
 
+def _filename_char(m):
+    return '-' if m.group(1) else ''
+
+
+@lru_cache(maxsize=256)
 def sanitize_filename(s):
     """Replace characters that are problematic in filenames.
     'Ord. 26-006' -> 'Ord-26-006'
     """
-    s = re.sub(r'\.\s*', '-', s)  # "Ord. " -> "Ord-"
-    s = re.sub(r'\s+', '-', s)    # remaining spaces
-    s = re.sub(r'[^\w\-]', '', s) # remove anything else
-    s = re.sub(r'-+', '-', s)     # collapse multiple dashes
+    s = _FILENAME_CHAR_RE.sub(_filename_char, s)
+    s = _DASHES_RE.sub('-', s)  # collapse multiple dashes
     return s.strip('-')
 
 
@@ -69,16 +93,71 @@ def validate_split(packet_doc, item, page_start_0, page_end_0):
     # Normalize for matching: "Ord. 26-006" -> "Ord. 26-006" or "Ord.26-006"
     norm = file_number.replace(" ", "")
 
-    # Check first few pages of the range for the file number
+    # Check first few pages of the range for the file number. Each page is
+    # extracted once, straight into a TextPage; reading its full text is
+    # cheaper than cutting a header band out of it.
     for pg in range(page_start_0, min(page_end_0 + 1, page_start_0 + 3)):
-        text = packet_doc[pg].get_text("text")
-        text_norm = text.replace(" ", "")
+        textpage = packet_doc[pg].get_textpage(flags=_TEXT_FLAGS)
+        text_norm = textpage.extractText().replace(" ", "")
         if norm in text_norm:
             return True
 
     return False
 
 
+def _split_items(packet_doc, output_dir, jobs):
+    """Validate and write one PDF per (item, start_0, end_0, rel_path) job.
+
+    Returns the validate_split() result for each job, in order.
+    """
+    results = []
+    for item, start_0, end_0, rel_path in jobs:
+        results.append(validate_split(packet_doc, item, start_0, end_0))
+        out_doc = fitz.open()
+        out_doc.insert_pdf(packet_doc, from_page=start_0, to_page=end_0)
+        out_doc.save(os.path.join(output_dir, rel_path))
+        out_doc.close()
+    return results
+
+
+def _split_items_worker(packet_path, output_dir, jobs):
+    """Run _split_items() on a private handle to the packet (runs in a worker
+    process; PyMuPDF is not thread-safe)."""
+    with fitz.open(packet_path) as packet_doc:
+        return _split_items(packet_doc, output_dir, jobs)
+
+
+def split_items(packet_doc, packet_path, output_dir, jobs):
+    """Split all jobs, in parallel worker processes for large packets.
+
+    Each worker gets a contiguous run of jobs and opens packet_path once.
+    Results come back in job order.
+    """
+    workers = min(MAX_SPLIT_WORKERS, os.cpu_count() or 1)
+    if workers < 2 or len(jobs) < PARALLEL_MIN_ITEMS:
+        return _split_items(packet_doc, output_dir, jobs)
+
+    step = -(-len(jobs) // workers)  # ceil division
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        futures = [ex.submit(_split_items_worker, packet_path, output_dir,
+                             jobs[start:start + step])
+                   for start in range(0, len(jobs), step)]
+        return [valid for fut in futures for valid in fut.result()]
+
+
+def _dump_json(result, path):
+    """Write result to path as JSON indented by 2 spaces.
+
+    Uses orjson when it is installed, otherwise the standard json module.
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
 def split_packet(packet_path, agenda_path, output_dir):
     """Split packet PDF based on agenda JSON."""
     with open(agenda_path) as f:
@@ -102,9 +181,9 @@ def split_packet(packet_path, agenda_path, output_dir):
     # Sort by page_start
     items_to_split.sort(key=lambda x: x[0]["page_start"])
 
-    # Create output directories
-    os.makedirs(os.path.join(output_dir, "agenda"), exist_ok=True)
-    for subdir in set(SECTION_DIR_MAP.values()):
+    # Create output directories, including "other" for items whose section
+    # type has no entry in SECTION_DIR_MAP
+    for subdir in set(SECTION_DIR_MAP.values()) | {"agenda", "other"}:
         os.makedirs(os.path.join(output_dir, subdir), exist_ok=True)
 
     manifest_entries = []
@@ -128,45 +207,44 @@ def split_packet(packet_path, agenda_path, output_dir):
         "page_start": 1,
         "page_end": agenda_pages,
         "page_count": agenda_page_count,
-        "output_file": os.path.join("agenda", "00.00_agenda.pdf"),
+        "output_file": "agenda/00.00_agenda.pdf",
     })
 
     print(f"\nExtracted agenda: pages 1-{agenda_pages} ({agenda_page_count} pages)")
 
-    # 2. Extract each agenda item
+    # 2. Extract each agenda item. Items inside the packet are validated and
+    # written first (in parallel for large packets), then reported in page
+    # order.
+    plan = []
     for item, sec_type in items_to_split:
+        # Convert 1-indexed page numbers to 0-indexed for PyMuPDF
+        start_0 = item["page_start"] - 1
+        end_0 = item["page_end"] - 1
+        rel_path = None
+        if start_0 >= 0 and end_0 < total_packet_pages:
+            rel_path = f"{subdir_for_item(item, sec_type)}/{build_filename(item)}"
+        plan.append((item, start_0, end_0, rel_path))
+    jobs = [job for job in plan if job[3] is not None]
+    valid = iter(split_items(packet, packet_path, output_dir, jobs))
+
+    for item, start_0, end_0, rel_path in plan:
         page_start = item["page_start"]  # 1-indexed
         page_end = item["page_end"]      # 1-indexed
 
-        # Convert to 0-indexed for PyMuPDF
-        start_0 = page_start - 1
-        end_0 = page_end - 1
-
         # Bounds check
-        if start_0 < 0 or end_0 >= total_packet_pages:
+        if rel_path is None:
             msg = f"WARNING: Item {item['item_number']} pages {page_start}-{page_end} out of bounds (packet has {total_packet_pages} pages)"
             warnings.append(msg)
             print(msg)
             continue
 
         # Validate content
-        if not validate_split(packet, item, start_0, end_0):
+        if not next(valid):
             msg = f"WARNING: Item {item['item_number']} - file number '{item.get('file_number')}' not found in pages {page_start}-{page_end}"
             warnings.append(msg)
             print(msg)
 
-        # Extract
-        out_doc = fitz.open()
-        out_doc.insert_pdf(packet, from_page=start_0, to_page=end_0)
-
-        subdir = subdir_for_item(item, sec_type)
-        filename = build_filename(item)
-        rel_path = os.path.join(subdir, filename)
-        full_path = os.path.join(output_dir, rel_path)
-
-        out_doc.save(full_path)
         page_count = end_0 - start_0 + 1
-        out_doc.close()
         total_pages_split += page_count
 
         manifest_entries.append({
@@ -193,8 +271,7 @@ def split_packet(packet_path, agenda_path, output_dir):
     }
 
     manifest_path = os.path.join(output_dir, "manifest.json")
-    with open(manifest_path, "w") as f:
-        json.dump(manifest, f, indent=2)
+    _dump_json(manifest, manifest_path)
 
     # 4. Summary
     print(f"\nSummary:")